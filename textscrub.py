@@ -1,17 +1,198 @@
 #!/usr/bin/env python3
 
-import os
-import json
-import tkinter as tk
-from tkinter import filedialog, simpledialog, messagebox
-import signal
-import sys
+import time
+STARTUP_T0 = time.perf_counter()  # Taken before tkinter is imported, for --startup-time
+
+import argparse  # noqa: E402
+import os  # noqa: E402
+import json  # noqa: E402
+import queue  # noqa: E402
+import shutil  # noqa: E402
+import tempfile  # noqa: E402
+import threading  # noqa: E402
+import tkinter as tk  # noqa: E402
+from tkinter import filedialog, simpledialog, messagebox  # noqa: E402
+import signal  # noqa: E402
+import sys  # noqa: E402
 
 # Global list to store key-value pairs for bulk replacement
 bulk_replace_pairs = []
 selected_theme = "Standard"  # Default theme
 
 STATUS_MESSAGE_DURATION_MS = 0
+SAVE_CHUNK_LINES = 2000  # Lines pulled from the text widget per save step
+SAVE_QUEUE_CHUNKS = 4    # Chunks allowed to wait for the writer before reading pauses
+PREFS_BACKUP_COUNT = 3   # Rotating prefs backups kept as .bak.1 .. .bak.N
+PREFS_LOAD_TIMEOUT_S = 5  # Longest a replace or exit will wait for the background prefs load
+
+# os.umask can only be read by setting it, so do that once before any threads start
+PROCESS_UMASK = os.umask(0)
+os.umask(PROCESS_UMASK)
+
+THEME_CONFIGS = {
+    "Standard": {
+        "bg": "white",
+        "fg": "black",
+        "menu_bg": "lightgrey",
+        "menu_fg": "black",
+        "dialog_bg": "white",
+        "cursor_color": "black"  # Added cursor color
+    },
+    "Dark": {
+        "bg": "#002b36",
+        "fg": "#839496",
+        "menu_bg": "#073642",
+        "menu_fg": "#839496",
+        "dialog_bg": "#002b36",
+        "cursor_color": "white"  # Added cursor color
+    },
+    "Light": {
+        "bg": "#fdf6e3",
+        "fg": "#657b83",
+        "menu_bg": "#eee8d5",
+        "menu_fg": "#657b83",
+        "dialog_bg": "#fdf6e3",
+        "cursor_color": "black"  # Added cursor color
+    }
+}
+
+
+def atomic_write(path, chunks):
+    """Write an iterable of strings to path without ever leaving it half written.
+
+    The data goes to a temp file in the same directory, is fsync'd, and is then
+    renamed over path, so a crash or kill mid-write leaves the old file intact.
+    Symlinks are followed, so the rename lands on the real file, not the link.
+    """
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as file:
+            for chunk in chunks:
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            # mkstemp creates 0600; give new files the mode open(path, 'w') would
+            os.chmod(tmp_path, 0o666 & ~PROCESS_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    # Make the rename itself durable
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def rotate_backups(path, count=PREFS_BACKUP_COUNT):
+    """Shift path.bak.1 .. path.bak.N down one slot and copy path into .bak.1."""
+    if count < 1 or not os.path.exists(path):
+        return
+    for i in range(count - 1, 0, -1):
+        older = f"{path}.bak.{i}"
+        if os.path.exists(older):
+            os.replace(older, f"{path}.bak.{i + 1}")
+    shutil.copy2(path, f"{path}.bak.1")
+
+
+def parse_prefs(prefs):
+    """Validate a decoded prefs file; raises ValueError if its layout is wrong.
+
+    Returns a dict with the rule pairs normalised to (key, value) tuples.
+    Malformed entries inside the pair list are skipped rather than rejected.
+    """
+    if not isinstance(prefs, dict):
+        raise ValueError("expected a JSON object")
+    raw_pairs = prefs.get("bulk_replace_pairs", [])
+    if not isinstance(raw_pairs, list):
+        raise ValueError("bulk_replace_pairs is not a list")
+    theme = prefs.get("selected_theme", "Standard")
+    if not isinstance(theme, str):
+        raise ValueError("selected_theme is not a string")
+    if theme not in THEME_CONFIGS:
+        theme = "Standard"
+
+    pairs = []
+    for pair in raw_pairs:
+        if (isinstance(pair, (list, tuple)) and len(pair) == 2
+                and all(isinstance(item, str) for item in pair) and pair[0]):
+            pairs.append((pair[0], pair[1]))
+        else:
+            print(f"Skipping malformed bulk replace pair: {pair!r}")
+    return {"bulk_replace_pairs": pairs, "selected_theme": theme}
+
+
+def load_prefs(prefs_file):
+    """Read and parse the prefs file, falling back to the newest readable backup.
+
+    Touches no Tk state, so it is safe to run on a worker thread. A candidate
+    that can't be read or fails parse_prefs is skipped and the next backup is
+    tried. Returns the parsed prefs, or None if no candidate was usable.
+    """
+    candidates = [prefs_file] + [f"{prefs_file}.bak.{i}" for i in range(1, PREFS_BACKUP_COUNT + 1)]
+    for candidate in candidates:
+        if not os.path.exists(candidate):
+            continue
+        try:
+            with open(candidate, 'r') as file:
+                return parse_prefs(json.load(file))
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Could not read preferences from {candidate}: {e}")
+    return None
+
+
+class SaveJob:
+    """One background save: the chunk queue, the writer thread and how far the buffer has been read.
+
+    The Tk side fills `chunks` (ending with None) and the writer thread drains
+    it into atomic_write. `cancelled` is set by the writer when it fails, so
+    the reader stops producing chunks nobody will consume, and by the Tk side
+    when it abandons the job, so the writer stops waiting, removes its temp
+    file and leaves the target untouched.
+    """
+
+    def __init__(self, file_path, last_line):
+        self.file_path = file_path
+        self.last_line = last_line
+        self.next_line = 1
+        self.all_queued = False
+        self.chunks = queue.Queue()
+        self.result = queue.Queue()
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self.write, daemon=True)
+
+    def write(self):
+        """Worker thread: stream chunks from the queue into file_path atomically."""
+        def drain():
+            while True:
+                try:
+                    chunk = self.chunks.get(timeout=0.1)
+                except queue.Empty:
+                    if self.cancelled.is_set():
+                        raise InterruptedError(f"save of {self.file_path} was cancelled")
+                    continue
+                if chunk is None:
+                    return
+                yield chunk
+        try:
+            atomic_write(self.file_path, drain())
+            self.result.put(None)
+        except Exception as e:
+            self.cancelled.set()
+            self.result.put(e)
 
 
 class BulkReplaceDialog(simpledialog.Dialog):
@@ -63,7 +244,8 @@ class BulkReplaceDialog(simpledialog.Dialog):
         super().apply()  # Close the dialog
 
     def write_prefs_and_notify(self):
-        app.writePrefs()
+        if not app.writePrefs():
+            return  # writePrefs already said why in the status bar
         config_dir = os.path.join(os.path.expanduser("~"), ".config", "textscrub")
         prefs_file = os.path.join(config_dir, "textscrub-prefs.json")
         app.update_status(f"Bulk hash saved to: {prefs_file}")
@@ -102,13 +284,29 @@ class SimpleTextEditor:
     def __init__(self, root):
         self.root = root
         self.root.title("TextScrub Editor")
+        # Closing the window goes through exit_app so a running save can finish
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
 
         self.text_area = tk.Text(root, undo=True)
         self.text_area.pack(expand=True, fill='both')
 
+        # Background save state, see save_file
+        self.save_job = None
+        # If the buffer goes away mid-save nothing will feed the writer again
+        self.text_area.bind("<Destroy>", self.abandon_save, add="+")
+        self.exit_pending = False  # exit_app is already waiting on save_job
+
+        # Background prefs load state, see readPrefs
+        self.prefs_thread = None
+        self.prefs_result = None
+        self.prefs_loaded = False  # Only True once the saved prefs were actually read
+        self.theme_chosen = False  # Set once the user picks a theme; the saved one then loses
+        self.startup_report = False
+
         self.menu_bar = tk.Menu(root)
         root.config(menu=self.menu_bar)
 
+        # Menus are filled in the first time they are opened
         self.create_file_menu()
         self.create_edit_menu()
         self.create_search_menu()
@@ -118,12 +316,9 @@ class SimpleTextEditor:
         # Bind hotkeys
         self.bind_hotkeys()
 
-        # Read preferences
+        # Read preferences in the background; the saved theme is applied once they land
         self.readPrefs()
 
-        # Apply the saved theme
-        self.apply_theme(selected_theme)
-
     def setup_signal_handling(self):
         """
         Set up robust signal handling for clean and immediate application exit.
@@ -152,6 +347,9 @@ class SimpleTextEditor:
         try:
             # Immediately stop any ongoing tkinter main loop
             self.root.after(0, self.root.quit)
+
+            # Let an in-flight document save land (or clean up) before we go
+            self.finish_save()
             
             # Save application preferences before exiting
             self.writePrefs()
@@ -192,9 +390,21 @@ class SimpleTextEditor:
         if duration > 0:
             self.root.after(duration, lambda: self.update_status(""))
             
+    def add_lazy_menu(self, label, populate):
+        """Add an empty cascade to the menu bar that runs populate(menu) on first open."""
+        menu = tk.Menu(self.menu_bar, tearoff=0)
+        self.menu_bar.add_cascade(label=label, menu=menu, underline=0)
+
+        def build():
+            menu.config(postcommand="")
+            populate(menu)
+
+        menu.config(postcommand=build)
+
     def create_file_menu(self):
-        file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="File", menu=file_menu, underline=0)
+        self.add_lazy_menu("File", self.populate_file_menu)
+
+    def populate_file_menu(self, file_menu):
         file_menu.add_command(label="New", command=self.new_file, accelerator="Ctrl+N")
         file_menu.add_command(label="Open", command=self.open_file, accelerator="Ctrl+O")
         file_menu.add_command(label="Save", command=self.save_file, accelerator="Ctrl+S")
@@ -202,8 +412,9 @@ class SimpleTextEditor:
         file_menu.add_command(label="Exit", command=self.exit_app, accelerator="Alt+F4")
 
     def create_edit_menu(self):
-        edit_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="Edit", menu=edit_menu, underline=0)
+        self.add_lazy_menu("Edit", self.populate_edit_menu)
+
+    def populate_edit_menu(self, edit_menu):
         edit_menu.add_command(label="Undo", command=self.text_area.edit_undo, accelerator="Ctrl+Z")
         edit_menu.add_command(label="Redo", command=self.text_area.edit_redo, accelerator="Ctrl+Y")
         edit_menu.add_separator()
@@ -219,13 +430,14 @@ class SimpleTextEditor:
         # Create theme submenu
         theme_menu = tk.Menu(edit_menu, tearoff=0)
         edit_menu.add_cascade(label="Theme", menu=theme_menu)
-        theme_menu.add_command(label="Standard", command=lambda: self.apply_theme("Standard"))
-        theme_menu.add_command(label="Dark", command=lambda: self.apply_theme("Dark"))
-        theme_menu.add_command(label="Light", command=lambda: self.apply_theme("Light"))
+        theme_menu.add_command(label="Standard", command=lambda: self.choose_theme("Standard"))
+        theme_menu.add_command(label="Dark", command=lambda: self.choose_theme("Dark"))
+        theme_menu.add_command(label="Light", command=lambda: self.choose_theme("Light"))
 
     def create_search_menu(self):
-        search_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="Search", menu=search_menu, underline=0)
+        self.add_lazy_menu("Search", self.populate_search_menu)
+
+    def populate_search_menu(self, search_menu):
         search_menu.add_command(label="Find", command=self.find_text, accelerator="Ctrl+F")
         search_menu.add_command(label="Bulk Replace", command=self.bulk_replace, accelerator="Ctrl+B")
     
@@ -241,12 +453,29 @@ class SimpleTextEditor:
         self.root.bind('<Control-a>', lambda e: self.select_all())
         self.root.bind('<Control-g>', lambda e: self.bulkReplaceReverse())
 
+    def save_in_progress(self):
+        """Return True, and say so in the status bar, while a save is still reading the buffer.
+
+        The buffer is disabled during a save and Tk silently drops edits to it,
+        so handlers that change the text check this first rather than report
+        work they didn't do.
+        """
+        if self.save_job is None:
+            return False
+        self.update_status(f"Still saving {self.save_job.file_path}, try again when it finishes",
+                           STATUS_MESSAGE_DURATION_MS)
+        return True
+
     def new_file(self):
+        if self.save_in_progress():
+            return
         self.text_area.delete(1.0, tk.END)
         self.update_status(f"New file created", STATUS_MESSAGE_DURATION_MS)
 
 
     def open_file(self):
+        if self.save_in_progress():
+            return
         file_path = filedialog.askopenfilename()
         if file_path:
             with open(file_path, 'r') as file:
@@ -258,13 +487,94 @@ class SimpleTextEditor:
 
 
     def save_file(self):
+        if self.save_job is not None:
+            self.update_status("A save is already in progress", STATUS_MESSAGE_DURATION_MS)
+            return
         file_path = filedialog.asksaveasfilename(defaultextension=".txt",
                                                  filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")])
         if file_path:
-            with open(file_path, 'w') as file:
-                content = self.text_area.get(1.0, tk.END)
-                file.write(content)
-            self.update_status(f"Saved {file_path}", STATUS_MESSAGE_DURATION_MS)
+            # The buffer is read-only while it streams out so the chunks stay consistent
+            self.text_area.config(state=tk.DISABLED)
+            last_line = int(self.text_area.index("end-1c").split('.')[0])
+            self.save_job = SaveJob(file_path, last_line)
+            self.save_job.thread.start()
+            self.update_status(f"Saving {file_path}...")
+            self._queue_save_chunk(self.save_job)
+            self._poll_save(self.save_job)
+
+    def _read_save_chunk(self, job):
+        """Put the next SAVE_CHUNK_LINES lines of the buffer on job's queue."""
+        end_line = job.next_line + SAVE_CHUNK_LINES
+        if end_line > job.last_line:
+            # "end-1c" skips the newline Tk always keeps after the last line
+            job.chunks.put(self.text_area.get(f"{job.next_line}.0", "end-1c"))
+            job.chunks.put(None)
+            job.all_queued = True
+            self.text_area.config(state=tk.NORMAL)
+            return
+        job.chunks.put(self.text_area.get(f"{job.next_line}.0", f"{end_line}.0"))
+        job.next_line = end_line
+
+    def _queue_save_chunk(self, job):
+        """Feed the writer one chunk at a time from the Tk loop, pausing while it is behind."""
+        if job is not self.save_job or job.cancelled.is_set():
+            return  # The writer failed; _poll_save re-enables the buffer
+        if job.chunks.qsize() >= SAVE_QUEUE_CHUNKS:
+            self.root.after(10, self._queue_save_chunk, job)
+            return
+        self._read_save_chunk(job)
+        if not job.all_queued:
+            self.root.after(1, self._queue_save_chunk, job)
+
+    def abandon_save(self, event=None):
+        """Cancel an in-flight save whose chunks will never arrive and wait for the cleanup."""
+        job = self.save_job
+        if job is None:
+            return
+        self.save_job = None
+        job.cancelled.set()
+        job.thread.join()
+        print(f"Save of {job.file_path} was abandoned; the file was left unchanged")
+
+    def finish_save(self):
+        """Synchronously queue the rest of an in-flight save and wait for the writer.
+
+        Used on the signal path, where the Tk loop won't run the chunk chain
+        again. Reports the outcome on the console.
+        """
+        job = self.save_job
+        if job is None:
+            return
+        while not job.all_queued and not job.cancelled.is_set():
+            if job.chunks.qsize() >= SAVE_QUEUE_CHUNKS:
+                time.sleep(0.01)
+                continue
+            self._read_save_chunk(job)
+        job.thread.join()
+        self.save_job = None
+        error = job.result.get()
+        if error is None:
+            print(f"Saved {job.file_path}")
+        else:
+            print(f"Save of {job.file_path} failed: {error}")
+
+    def _poll_save(self, job):
+        """Check on the writer thread from the Tk loop (Tk isn't thread-safe)."""
+        if job is not self.save_job:
+            return  # Already collected by finish_save
+        try:
+            error = job.result.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_save, job)
+            return
+        job.thread.join()
+        self.save_job = None
+        self.text_area.config(state=tk.NORMAL)
+        if error is None:
+            self.update_status(f"Saved {job.file_path}", STATUS_MESSAGE_DURATION_MS)
+        else:
+            self.update_status(f"Save failed: {error}", STATUS_MESSAGE_DURATION_MS)
+            messagebox.showerror("Save failed", f"Could not save {job.file_path}:\n{error}")
 
 
     def cut_text(self):
@@ -529,6 +839,8 @@ class SimpleTextEditor:
 
 
     def bulk_replace(self):
+        if not self.ensure_prefs_loaded():
+            return
         dialog = BulkReplaceDialog(self.root, "Bulk Replace")
         #if dialog.pairs:  # Only perform replacement if the dialog returned pairs (Save and Replace)
         #    content = self.text_area.get("1.0", tk.END)
@@ -549,7 +861,10 @@ class SimpleTextEditor:
         #                            foreground="black")
 
     def replaceBulk(self):
-        content = self.text_area.get("1.0", tk.END)
+        if self.save_in_progress():
+            return
+        if not self.ensure_prefs_loaded():
+            return
         self.text_area.tag_remove("highlight", "1.0", tk.END)  # Remove existing highlights
         replacement_count = 0
         
@@ -570,7 +885,10 @@ class SimpleTextEditor:
         self.update_status(f"Performed {replacement_count} replacements", STATUS_MESSAGE_DURATION_MS)
 
     def bulkReplaceReverse(self):
-        content = self.text_area.get("1.0", tk.END)  # Get entire text
+        if self.save_in_progress():
+            return
+        if not self.ensure_prefs_loaded():
+            return
         self.text_area.tag_remove("highlight", "1.0", tk.END)  # Clear existing highlights
         replacement_count = 0
 
@@ -592,37 +910,15 @@ class SimpleTextEditor:
         self.update_status(f"Performed {replacement_count} reverse replacements", STATUS_MESSAGE_DURATION_MS)
 
 
+    def choose_theme(self, theme):
+        """Apply a theme picked from the menu, so a still-loading saved theme won't replace it."""
+        self.theme_chosen = True
+        self.apply_theme(theme)
+
     def apply_theme(self, theme):
         global selected_theme
-        theme_configs = {
-            "Standard": {
-                "bg": "white",
-                "fg": "black",
-                "menu_bg": "lightgrey",
-                "menu_fg": "black",
-                "dialog_bg": "white",
-                "cursor_color": "black"  # Added cursor color
-            },
-            "Dark": {
-                "bg": "#002b36",
-                "fg": "#839496",
-                "menu_bg": "#073642",
-                "menu_fg": "#839496",
-                "dialog_bg": "#002b36",
-                "cursor_color": "white"  # Added cursor color
-            },
-            "Light": {
-                "bg": "#fdf6e3",
-                "fg": "#657b83",
-                "menu_bg": "#eee8d5",
-                "menu_fg": "#657b83",
-                "dialog_bg": "#fdf6e3",
-                "cursor_color": "black"  # Added cursor color
-            }
-        }
-        
-        if theme in theme_configs:
-            config = theme_configs[theme]
+        if theme in THEME_CONFIGS:
+            config = THEME_CONFIGS[theme]
             self.text_area.config(
                 bg=config["bg"],
                 fg=config["fg"],
@@ -644,37 +940,143 @@ class SimpleTextEditor:
                 widget.config(bg=bg_color, fg=fg_color)
 
     def readPrefs(self):
-        global bulk_replace_pairs, selected_theme
+        """Start loading prefs on a worker thread and poll for them from the Tk loop."""
         config_dir = os.path.join(os.path.expanduser("~"), ".config", "textscrub")
         prefs_file = os.path.join(config_dir, "textscrub-prefs.json")
 
-        if os.path.exists(prefs_file):
-            with open(prefs_file, 'r') as file:
-                prefs = json.load(file)
-                bulk_replace_pairs.extend(prefs.get("bulk_replace_pairs", []))
-                selected_theme = prefs.get("selected_theme", "Standard")
+        self.prefs_result = queue.Queue()
+        self.prefs_thread = threading.Thread(target=self._load_prefs_worker, args=(prefs_file,),
+                                             daemon=True)
+        self.prefs_thread.start()
+        self.root.after(10, self._poll_prefs)
+
+    def _load_prefs_worker(self, prefs_file):
+        """Worker thread: always leaves exactly one result (prefs, None or the error) behind."""
+        try:
+            result = load_prefs(prefs_file)
+        except Exception as e:
+            result = e
+        self.prefs_result.put(result)
+
+    def _poll_prefs(self):
+        if self.prefs_thread is None:
+            return
+        if self.prefs_thread.is_alive():
+            self.root.after(10, self._poll_prefs)
+            return
+        self.ensure_prefs_loaded()
+
+    def ensure_prefs_loaded(self):
+        """Wait for the background prefs load and apply it (once).
+
+        Anything that reads or writes the rule list calls this first, so the
+        pairs are in place before the first replace. Returns False if the load
+        is still running after PREFS_LOAD_TIMEOUT_S; the thread is kept and
+        _poll_prefs picks up its result later. A failed load leaves
+        prefs_loaded False, which stops writePrefs from overwriting the rules.
+        """
+        global bulk_replace_pairs, selected_theme
+        if self.prefs_thread is None:
+            return True
+        self.prefs_thread.join(PREFS_LOAD_TIMEOUT_S)
+        if self.prefs_thread.is_alive():
+            self.update_status("Preferences are still loading, try again in a moment",
+                               STATUS_MESSAGE_DURATION_MS)
+            return False
+        self.prefs_thread = None
+        try:
+            prefs = self.prefs_result.get_nowait()
+        except queue.Empty:
+            prefs = RuntimeError("the prefs loader exited without a result")
+        if isinstance(prefs, Exception):
+            print(f"Could not load preferences, using defaults: {prefs}")
+            self.update_status(f"Could not load preferences: {prefs}", STATUS_MESSAGE_DURATION_MS)
+            prefs = None
+        else:
+            self.prefs_loaded = True
+        if prefs is not None:
+            bulk_replace_pairs.extend(prefs["bulk_replace_pairs"])
+            if not self.theme_chosen:
+                selected_theme = prefs["selected_theme"]
+        # The window first paints with Tk's default colors; the saved theme lands here
+        if not self.theme_chosen:
+            self.apply_theme(selected_theme)
+        if self.startup_report:
+            print(f"startup: prefs ready in {(time.perf_counter() - STARTUP_T0) * 1000:.1f} ms "
+                  f"({len(bulk_replace_pairs)} rules)")
+        return True
+
+    def report_startup_time(self):
+        """Print time-to-first-paint, and prefs-ready time, measured from script start (before tkinter is imported)."""
+        self.startup_report = True
+
+        def on_first_paint(event):
+            self.text_area.unbind("<Expose>", bind_id)
+            print(f"startup: first paint in {(time.perf_counter() - STARTUP_T0) * 1000:.1f} ms")
+
+        bind_id = self.text_area.bind("<Expose>", on_first_paint, add="+")
 
     def writePrefs(self):
+        """Save prefs; returns False without touching the file if they were never loaded."""
         global bulk_replace_pairs, selected_theme
         config_dir = os.path.join(os.path.expanduser("~"), ".config", "textscrub")
-        os.makedirs(config_dir, exist_ok=True)
         prefs_file = os.path.join(config_dir, "textscrub-prefs.json")
 
-        prefs = {"bulk_replace_pairs": bulk_replace_pairs, "selected_theme": selected_theme}
-        with open(prefs_file, 'w') as file:
-            json.dump(prefs, file)
+        # Writing now would replace the saved rules with whatever this session has
+        if not self.ensure_prefs_loaded() or not self.prefs_loaded:
+            print(f"Preferences were not loaded; leaving {prefs_file} untouched")
+            self.update_status(f"Preferences were not loaded; {prefs_file} left untouched",
+                               STATUS_MESSAGE_DURATION_MS)
+            return False
+
+        os.makedirs(config_dir, exist_ok=True)
+        prefs = json.dumps({"bulk_replace_pairs": bulk_replace_pairs, "selected_theme": selected_theme})
+
+        # Unchanged prefs: rewriting would only rotate an identical copy into the backups
+        try:
+            with open(prefs_file, 'r') as file:
+                if file.read() == prefs:
+                    return True
+        except OSError:
+            pass
+
+        rotate_backups(prefs_file)
+        atomic_write(prefs_file, [prefs])
+        return True
 
     def exit_app(self):
+        if self.save_job is not None:
+            # Don't pull the rug out from under the writer thread; one wait is enough
+            if not self.exit_pending:
+                self.exit_pending = True
+                self.update_status("Waiting for save to finish...")
+                self.root.after(100, self._exit_when_saved)
+            return
         self.writePrefs()
         self.root.quit()
 
+    def _exit_when_saved(self):
+        if self.save_job is not None:
+            self.root.after(100, self._exit_when_saved)
+            return
+        self.exit_pending = False
+        self.exit_app()
+
 
 def main():
     global app
+    parser = argparse.ArgumentParser(description="TextScrub bulk replace editor")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="print time-to-first-paint and prefs load time (ms since script start, including the tkinter import)")
+    args = parser.parse_args()
+
     root = tk.Tk()
     app = SimpleTextEditor(root)
+    if args.startup_time:
+        app.report_startup_time()
     app.setup_signal_handling() #<-- setup signal handling
     root.mainloop() #<-- Start the main loop
+    app.abandon_save()  # No-op unless the loop ended without waiting for a save
 
 if __name__ == "__main__":
     main()